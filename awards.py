@@ -1,10 +1,27 @@
 from __future__ import annotations
+from operator import itemgetter
 from data_structures.referential_array import ArrayR
 from constants import PlayerStats
 from season import Season
 
 
 class Awards:
+    # Column order of the stats following the player name in each leaderboard entry
+    _STAT_ORDER = (
+        PlayerStats.GAMES_PLAYED,
+        PlayerStats.GOALS,
+        PlayerStats.ASSISTS,
+        PlayerStats.TACKLES,
+        PlayerStats.INTERCEPTIONS,
+        PlayerStats.STAR_SKILL,
+        PlayerStats.WEAK_FOOT_ABILITY,
+        PlayerStats.WEIGHT,
+        PlayerStats.HEIGHT,
+    )
+    _STAT_INDICES = tuple(stat.ordinal for stat in _STAT_ORDER)
+    # Pulls the stats above out of Player.statistics as one tuple
+    _get_stat_record = staticmethod(itemgetter(*_STAT_INDICES))
+
     def __init__(self, season: Season, player_stat: PlayerStats, num_top_players: int) -> None:
         """
         Initializes the awards based on the provided teams, player stat and top players.
@@ -22,14 +39,14 @@ class Awards:
         self.player_stat = player_stat
         self.num_top_players = num_top_players
 
-    def get_leaderboard(self) -> ArrayR[ArrayR[int | str]]:
+    def get_leaderboard(self) -> ArrayR[tuple[int | str, ...]] | None:
         """
         Generates the leaderboard of awards.
 
         Returns:
-            ArrayR(ArrayR[ArrayR[int | str]]):
-                Outer array represents each team in the leaderboard
-                Inner array consists of 10 elements:
+            ArrayR(tuple[int | str, ...]):
+                Outer array holds min(num_top_players, team size) entries per team, in season team order
+                Each entry is a record (tuple) of 10 elements:
                     - Player Name (str)
                     - Games Played (int)
                     - Goals (int)
@@ -40,29 +57,30 @@ class Awards:
                     - Weak Foot Ability (int)
                     - Weight (int)
                     - Height (int)
+            None: When no players are tracked (no teams or players, no award stat or num_top_players <= 0)
 
         Complexity:
-            Best Case Complexity: O(T * P^2), where T is the number of teams, P is the number of players per team.
-            Worst Case Complexity: O(T * P^2)
+            Best Case Complexity: O(1), when no players are tracked.
+            Worst Case Complexity: O(T * P log P), where T is the number of teams, P is the number of players per team.
         """
-        leaderboard = []
-
         teams = self.season.get_teams()
+        if self.player_stat is None or self.num_top_players <= 0 or teams is None or len(teams) == 0:
+            return None
+        # A team smaller than num_top_players contributes all of its players and no more
+        total = 0
+        for team in teams:
+            total += min(len(team), self.num_top_players)
+        if total == 0:
+            return None
+        result = ArrayR(total)
+        k = 0
+        get_stat_record = self._get_stat_record
         for team in teams:
             top_players = team.get_top_x_players(self.player_stat, self.num_top_players)
             for stat_value, player_name, player in top_players:
-                player_stats_array = ArrayR(10)
-                player_stats_array[0] = player.get_name()
-                player_stats_array[1] = player[PlayerStats.GAMES_PLAYED]
-                player_stats_array[2] = player[PlayerStats.GOALS]
-                player_stats_array[3] = player[PlayerStats.ASSISTS]
-                player_stats_array[4] = player[PlayerStats.TACKLES]
-                player_stats_array[5] = player[PlayerStats.INTERCEPTIONS]
-                player_stats_array[6] = player[PlayerStats.STAR_SKILL]
-                player_stats_array[7] = player[PlayerStats.WEAK_FOOT_ABILITY]
-                player_stats_array[8] = player[PlayerStats.WEIGHT]
-                player_stats_array[9] = player[PlayerStats.HEIGHT]
-                leaderboard.append(player_stats_array)
+                result[k] = (player.get_name(), *get_stat_record(player.statistics))
+                k += 1
+        return result
 
     def __str__(self) -> str:
         """
@@ -35,6 +35,12 @@ class PlayerStats(Enum):
     HEIGHT = "Height"
 
 
+# Attach each stat's declaration position, so code holding a member can index by it directly
+for _ordinal, _stat in enumerate(PlayerStats):
+    _stat.ordinal = _ordinal
+del _ordinal, _stat
+
+
 class TeamStats(Enum):
     GAMES_PLAYED = "Games Played"
     POINTS = "Points"
@@ -47,6 +53,11 @@ class TeamStats(Enum):
     LAST_FIVE_RESULTS = "Last Five Results"
 
 
+for _ordinal, _stat in enumerate(TeamStats):
+    _stat.ordinal = _ordinal
+del _ordinal, _stat
+
+
 class PlayerPosition(Enum):
     """
     Enum class to represent the soccer positions
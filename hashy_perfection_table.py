@@ -3,6 +3,7 @@ from __future__ import annotations
 __author__ = 'Brendon Taylor'
 __since__ = '22/08/2024'
 
+import sys
 from data_structures.referential_array import ArrayR
 from typing import Generic, Union, TypeVar
 from constants import PlayerStats
@@ -33,20 +34,27 @@ class HashyPerfectionTable(Generic[K, V]):
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(13)
+        self._values: list[Union[V, None]] = [None] * 13
+        self._present: bytearray = bytearray(13)  # 1 at each position holding a value
         self.count: int = 0
 
+    # The only key that can live at each index, since the hash is perfect.
+    # The keys are interned so lookups with these same objects match on identity.
+    _index_to_key = tuple(sys.intern(stat.value) for stat in PlayerStats)
     # Create a mapping from key to index, with a class variable
-    _key_to_index = {stat.value: idx for idx, stat in enumerate(PlayerStats)}
+    _key_to_index = {key: idx for idx, key in enumerate(_index_to_key)}
 
     def hash(self, key: K) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
+        PlayerStats members hash straight to their ordinal, their string values via a lookup.
 
         Complexity:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
+        if type(key) is PlayerStats:
+            return key.ordinal
         try:
             return self._key_to_index[key]
         except KeyError:
@@ -60,30 +68,40 @@ class HashyPerfectionTable(Generic[K, V]):
 
     def keys(self) -> ArrayR[K]:
         """
-        Returns all keys in the hash table.
+        Returns all keys in the hash table, in PlayerStats order.
+        The scan stops as soon as every stored key has been found.
 
-        :complexity: O(M), where M is the size of the array.
+        :complexity: O(M), where M is the size of the table.
         """
-        res = ArrayR(len(self.array))
+        res = ArrayR(len(self._values))
+        present = self._present
+        index_to_key = self._index_to_key
         i = 0
-        for x in range(len(self)):
-            if self.array[x] is not None:
-                res[i] = self.array[x][0]
+        x = 0
+        while i < self.count:
+            if present[x]:
+                res[i] = index_to_key[x]
                 i += 1
+            x += 1
         return res
 
     def values(self) -> ArrayR[V]:
         """
-        Returns all values in the hash table.
+        Returns all values in the hash table, in PlayerStats order of their keys.
+        The scan stops as soon as every stored value has been found.
 
-        :complexity: O(M), where M is the size of the array.
+        :complexity: O(M), where M is the size of the table.
         """
-        res = ArrayR(len(self.array))
+        res = ArrayR(len(self._values))
+        present = self._present
+        values = self._values
         i = 0
-        for x in range(len(self)):
-            if self.array[x] is not None:
-                res[i] = self.array[x][1]
+        x = 0
+        while i < self.count:
+            if present[x]:
+                res[i] = values[x]
                 i += 1
+            x += 1
         return res
 
     def __contains__(self, key: K) -> bool:
@@ -91,15 +109,13 @@ class HashyPerfectionTable(Generic[K, V]):
         Checks to see if the given key is in the Hash Table
 
         Complexity:
-        Best Case Complexity: O(self[key])
-        Worst Case Complexity: O(self[key])
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        if type(key) is PlayerStats:
+            return self._present[key.ordinal] == 1
+        position = self._key_to_index.get(key)
+        return position is not None and self._present[position] == 1
 
     def __getitem__(self, key: K) -> V:
         """
@@ -113,9 +129,9 @@ class HashyPerfectionTable(Generic[K, V]):
         KeyError: When the key doesn't exist.
         """
         position: int = self.hash(key)
-        if self.array[position] is None:
+        if not self._present[position]:
             raise KeyError(f"{key} not found")
-        return self.array[position][1]
+        return self._values[position]
 
     def __setitem__(self, key: K, data: V) -> None:
         """
@@ -130,10 +146,11 @@ class HashyPerfectionTable(Generic[K, V]):
         """
         position: int = self.hash(key)
 
-        if self.array[position] is None:
+        if not self._present[position]:
             self.count += 1
+            self._present[position] = 1
 
-        self.array[position] = (key, data)
+        self._values[position] = data
 
     def __delitem__(self, key: K) -> None:
         """
@@ -147,24 +164,29 @@ class HashyPerfectionTable(Generic[K, V]):
         KeyError: When the key doesn't exist.
         """
         position: int = self.hash(key)
-        self.array[position] = None
+        if not self._present[position]:
+            raise KeyError(f"{key} not found")
+        self._present[position] = 0
+        self._values[position] = None
         self.count -= 1
 
     def is_empty(self) -> bool:
         return self.count == 0
 
     def is_full(self) -> bool:
-        return self.count == len(self.array)
+        return self.count == len(self._values)
 
     def __str__(self) -> str:
         """
         Complexity:
-            Best Case Complexity: O(M), where M is the size of the array.
+            Best Case Complexity: O(M), where M is the size of the table.
             Worst Case Complexity: O(M)
         """
-        result: str = ""
-        for item in self.array:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
+        parts: list[str] = []
+        present = self._present
+        values = self._values
+        index_to_key = self._index_to_key
+        for position in range(len(values)):
+            if present[position]:
+                parts.append(f"({index_to_key[position]},{values[position]})\n")
+        return "".join(parts)
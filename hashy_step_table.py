@@ -6,12 +6,13 @@ from __future__ import annotations
 __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
-from data_structures.referential_array import ArrayR
 from typing import Generic, TypeVar, Union
 
 K = TypeVar('K')
 V = TypeVar('V')
 
+_DELETED = object()  # Marks a lazily deleted slot, compared by identity
+
 
 class FullError(Exception):
     pass
@@ -23,7 +24,7 @@ class HashyStepTable(Generic[K, V]):
 
     Type Arguments:
         - K:    Key Type. In most cases should be string.
-                Otherwise `hash` should be overwritten.
+                Otherwise `hash` and `hash2` should be overwritten.
         - V:    Value Type.
 
     Unless stated otherwise, all methods have O(1) complexity.
@@ -45,9 +46,11 @@ class HashyStepTable(Generic[K, V]):
         if sizes is not None:
             self.TABLE_SIZES = sizes
         self.size_index = 0
-        self.array: ArrayR[Union[tuple[K, V], str, None]] = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._table_size = self.TABLE_SIZES[self.size_index]
+        self.array: list[Union[tuple[K, V], object, None]] = [None] * self._table_size
         self.count = 0
-        self.deleted = "<DELETED>"  # Initialise the deleted marker
+        self.deleted = _DELETED  # Initialise the deleted marker
+        self._hash_cache: dict[K, tuple[int, int]] = {}  # (position, step) of the stored keys at this size
 
     def hash(self, key: K) -> int:
         """
@@ -57,31 +60,103 @@ class HashyStepTable(Generic[K, V]):
         Best Case Complexity: O(len(key))
         Worst Case Complexity: O(len(key))
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        return self._hash_pair(key)[0]
 
     def hash2(self, key: K) -> int:
         """
         Used to determine the step size for our hash table.
 
         Complexity:
-        Best Case Complexity:
-        Worst Case Complexity:
+        Best Case Complexity: O(len(key))
+        Worst Case Complexity: O(len(key))
+        """
+        return self._hash_pair(key)[1]
+
+    def _hash_hooks_overridden(self) -> bool:
+        """
+        Whether `hash` or `hash2` has been replaced, on a subclass or on this instance,
+        in which case probing must go through them instead of the fused `_hash_pair`.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        cls = type(self)
+        return (cls.hash is not HashyStepTable.hash or cls.hash2 is not HashyStepTable.hash2
+                or 'hash' in self.__dict__ or 'hash2' in self.__dict__)
+
+    def _key_hashes(self, key: K) -> tuple[tuple[int, int], bool]:
+        """
+        Returns the initial position and step size of a key, as given by `hash` and `hash2`,
+        along with whether the caller may memoise them in `_hash_cache` once the key is stored.
+        Both come from one pass over the key unless either hook has been overridden,
+        in which case nothing is memoised. Unhashable keys are never memoised either.
+
+        Complexity:
+        Best Case Complexity: O(1), when the key's hashes are memoised.
+        Worst Case Complexity: O(len(key))
+        """
+        if self._hash_hooks_overridden():
+            return (self.hash(key), self.hash2(key)), False
+        try:
+            hashes = self._hash_cache.get(key)
+        except TypeError:  # Unhashable key
+            return self._hash_pair(key), False
+        if hashes is None:
+            return self._hash_pair(key), True
+        return hashes, False
+
+    def _hash_pair(self, key: K) -> tuple[int, int]:
+        """
+        Computes both the initial position (see `hash`) and the step size (see `hash2`)
+        in a single pass over the key.
+
+        Complexity:
+        Best Case Complexity: O(len(key))
+        Worst Case Complexity: O(len(key))
+        """
+        position = 0
+        step = 0
+        a = 31415
+        table_size = self._table_size
+        step_modulus = table_size - 1
+        hash_base = self.HASH_BASE
+        # Iterating bytes yields ints directly, so no per-character ord() call is needed.
+        # surrogatepass keeps str keys holding lone surrogates (e.g. from surrogateescape) hashable.
+        for code in (key if isinstance(key, str) else str(key)).encode('utf-8', 'surrogatepass'):
+            position = (code + a * position) % table_size
+            step = (step * hash_base + code) % step_modulus
+            a = a * hash_base % step_modulus
+        return position, step + 1  # Ensure step size is not zero
+
+    def _bulk_hash(self, keys: list[K]) -> tuple[list[int], list[int]]:
+        """
+        Computes the initial positions and step sizes (see `_key_hashes`) of many keys at once,
+        choosing between `_hash_pair` and the `hash`/`hash2` hooks once for the whole batch.
+
+        Complexity:
+        Best Case Complexity: O(L), where L is the total length of the keys.
+        Worst Case Complexity: O(L)
         """
-        value = 0
-        for char in str(key):
-            value = (value * self.HASH_BASE + ord(char)) % (self.table_size - 1)
-        step_size = value + 1  # Ensure step size is not zero
-        return step_size
+        positions = []
+        steps = []
+        if self._hash_hooks_overridden():
+            hash1 = self.hash
+            hash2 = self.hash2
+            for key in keys:
+                positions.append(hash1(key))
+                steps.append(hash2(key))
+        else:
+            hash_pair = self._hash_pair
+            for key in keys:
+                position, step = hash_pair(key)
+                positions.append(position)
+                steps.append(step)
+        return positions, steps
 
     @property
     def table_size(self) -> int:
-        return len(self.array)
+        return self._table_size
 
     def __len__(self) -> int:
         """
@@ -101,27 +176,68 @@ class HashyStepTable(Generic[K, V]):
             Best Case Complexity: O(1), when the desired position is found immediately.
             Worst Case Complexity: O(N), where N is the table size.
         """
-        # Initial position
-        position = self.hash(key)
+        (position, step), _ = self._key_hashes(key)
+        return self._probe_from(key, position, step, is_insert)
+
+    def _probe_from(self, key: K, position: int, step: int, is_insert: bool) -> int:
+        """
+        Walks the probe chain of a key from an already computed position and step size.
 
-        # Custom logic to be implemented here
-        step = self.hash2(key)
+        Raises:
+        KeyError: When the key is not in the table, but is_insert is False.
+        FullError: When a table is full and cannot be inserted.
 
-        for _ in range(self.table_size):
-            item = self.array[position]
+        Complexity:
+            Best Case Complexity: O(1), when the desired position is found immediately.
+            Worst Case Complexity: O(N), where N is the table size.
+        """
+        array = self.array
+        table_size = self._table_size
+        deleted = self.deleted
+        first_deleted = -1
+        for _ in range(table_size):
+            item = array[position]
             if item is None:
                 if is_insert:
-                    return position
+                    # Reuse the earliest deleted slot, the key is not further along the chain
+                    return position if first_deleted < 0 else first_deleted
                 else:
                     raise KeyError(f"{key} not found")
-            elif item == self.deleted:
-                if is_insert:
-                    return position
+            elif item is deleted:
+                if is_insert and first_deleted < 0:
+                    first_deleted = position
             elif item[0] == key:
                 return position
-            position = (position + step) % self.table_size
+            position = (position + step) % table_size
+        if is_insert and first_deleted >= 0:
+            return first_deleted
+        if not is_insert:
+            raise KeyError(f"{key} not found")
         raise FullError("Hash table is full")
     
+    def _probe_or_none(self, key: K) -> int:
+        """
+        Find the position of a stored key like `_hashy_probe` does for retrieval,
+        but return -1 instead of raising when the key is not in the table.
+
+        Complexity:
+            Best Case Complexity: O(1), when the key or an empty slot is found immediately.
+            Worst Case Complexity: O(N), where N is the table size.
+        """
+        (position, step), _ = self._key_hashes(key)
+
+        array = self.array
+        table_size = self._table_size
+        deleted = self.deleted
+        for _ in range(table_size):
+            item = array[position]
+            if item is None:
+                return -1
+            elif item is not deleted and item[0] == key:
+                return position
+            position = (position + step) % table_size
+        return -1
+
     def keys(self) -> list[K]:
         """
         Returns all keys in the hash table.
@@ -129,9 +245,10 @@ class HashyStepTable(Generic[K, V]):
         :complexity: O(N) where N is self.table_size.
         """
         res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][0])
+        deleted = self.deleted
+        for item in self.array:
+            if item is not None and item is not deleted:
+                res.append(item[0])
         return res
 
     def values(self) -> list[V]:
@@ -141,9 +258,10 @@ class HashyStepTable(Generic[K, V]):
         :complexity: O(N) where N is self.table_size.
         """
         res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][1])
+        deleted = self.deleted
+        for item in self.array:
+            if item is not None and item is not deleted:
+                res.append(item[1])
         return res
 
     def __contains__(self, key: K) -> bool:
@@ -152,12 +270,7 @@ class HashyStepTable(Generic[K, V]):
 
         :complexity: See hashy probe.
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self._probe_or_none(key) >= 0
 
     def __getitem__(self, key: K) -> V:
         """
@@ -176,15 +289,18 @@ class HashyStepTable(Generic[K, V]):
         :complexity: See hashy probe.
         :raises FullError: when the table cannot be resized further.
         """
+        hashes, cacheable = self._key_hashes(key)
+        position = self._probe_from(key, hashes[0], hashes[1], True)
 
-        position = self._hashy_probe(key, True)
-
-        if self.array[position] is None:
+        if self.array[position] is None or self.array[position] is self.deleted:
             self.count += 1
 
         self.array[position] = (key, data)
+        if cacheable:
+            # Only memoised once the key is actually stored
+            self._hash_cache[key] = hashes
 
-        if len(self) > self.table_size * 2 / 3:
+        if self.count > self._table_size * 2 / 3:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
@@ -198,6 +314,10 @@ class HashyStepTable(Generic[K, V]):
         position = self._hashy_probe(key, False)
         self.array[position] = self.deleted
         self.count -= 1
+        try:
+            self._hash_cache.pop(key, None)
+        except TypeError:  # Unhashable keys are never memoised
+            pass
 
     def is_empty(self) -> bool:
         return self.count == 0
@@ -207,7 +327,8 @@ class HashyStepTable(Generic[K, V]):
 
     def _rehash(self) -> None:
         """
-        Need to resize table and reinsert all values
+        Need to resize table and reinsert all values.
+        The positions and step sizes of all keys are computed before any probing.
 
         Complexity:
         Best Case Complexity: O(N), where N is the table size.
@@ -217,11 +338,34 @@ class HashyStepTable(Generic[K, V]):
         self.size_index += 1
         if self.size_index >= len(self.TABLE_SIZES):
             raise FullError("Maximum table size reached")
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._table_size = self.TABLE_SIZES[self.size_index]
+        self.array = [None] * self._table_size
         self.count = 0
-        for item in old_array:
-            if item is not None and item != self.deleted:
-                self[item[0]] = item[1]
+        items = [item for item in old_array if item is not None and item is not self.deleted]
+        keys = [key for key, _ in items]
+        positions, steps = self._bulk_hash(keys)
+        self._hash_cache = {}
+        if not self._hash_hooks_overridden():
+            hash_cache = self._hash_cache
+            for key, hashes in zip(keys, zip(positions, steps)):
+                try:
+                    hash_cache[key] = hashes
+                except TypeError:  # Unhashable keys are hashed on every lookup instead
+                    pass
+        # The new table holds no deleted markers or duplicate keys,
+        # so the first empty slot along each probe chain is the right one.
+        array = self.array
+        table_size = self._table_size
+        for item, position, step in zip(items, positions, steps):
+            for _ in range(table_size):
+                if array[position] is None:
+                    array[position] = item
+                    break
+                position = (position + step) % table_size
+            else:
+                # The step size cycles through occupied slots only, as in _probe_from
+                raise FullError("Hash table is full")
+        self.count = len(items)
 
     def __str__(self) -> str:
         """
@@ -229,9 +373,10 @@ class HashyStepTable(Generic[K, V]):
         order).
         :complexity: O(N), where N is the table size.
         """
-        result = ""
+        parts = []
+        deleted = self.deleted
         for item in self.array:
-            if item is not None:
+            if item is not None and item is not deleted:
                 (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
+                parts.append(f"({key},{value})\n")
+        return "".join(parts)
@@ -1,6 +1,9 @@
 from __future__ import annotations
+from array import array
 from constants import PlayerPosition, PlayerStats
-from data_structures.hash_table import LinearProbeTable
+
+# Statistics are packed as 32-bit signed ints (4 bytes each) instead of boxed Python ints
+_STAT_TYPECODE = 'i'
 
 class Player:
 
@@ -26,9 +29,7 @@ class Player:
         self.age: int = age
 
         # Initialise statistics
-        self.statistics: LinearProbeTable[str, int] = LinearProbeTable()
-        for stat in PlayerStats:
-            self.statistics[stat.value] = 0
+        self.statistics: array[int] = array(_STAT_TYPECODE, [0]) * len(PlayerStats)
 
     def reset_stats(self) -> None:
         """
@@ -42,8 +43,7 @@ class Player:
             Worst Case Complexity: O(N)
 
         """
-        for stat in PlayerStats:
-            self.statistics[stat.value] = 0
+        self.statistics[:] = array(_STAT_TYPECODE, [0]) * len(self.statistics)
 
     def get_name(self) -> str:
         """
@@ -76,7 +76,7 @@ class Player:
         Get the statistics of the player
 
         Returns:
-            statistics: The players' statistics
+            statistics: The players' statistics, indexed by PlayerStats ordinal
 
         Complexity:
             Best Case Complexity: O(1)
@@ -99,7 +99,7 @@ class Player:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        self.statistics[statistic.value] = value
+        self.statistics[statistic.ordinal] = value
 
     def __getitem__(self, statistic: PlayerStats) -> int:
         """
@@ -115,7 +115,7 @@ class Player:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self.statistics[statistic.value]
+        return self.statistics[statistic.ordinal]
 
     def __str__(self) -> str:
         """
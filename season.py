@@ -1,13 +1,21 @@
 from __future__ import annotations
-from data_structures.bset import BSet
+from collections import Counter
+from algorithms.mergesort import mergesort
 from data_structures.referential_array import ArrayR
-from data_structures.linked_list import LinkedList
 from dataclasses import dataclass
 from game_simulator import GameSimulator
 from team import Team
 from constants import GameResult, ResultStats, TeamStats, PlayerStats
 from typing import Generator, Union
 
+# Keys into a GameSimulator result, resolved once rather than per game
+_HOME_GOALS = ResultStats.HOME_GOALS.value
+_AWAY_GOALS = ResultStats.AWAY_GOALS.value
+_GOAL_SCORERS = ResultStats.GOAL_SCORERS.value
+_GOAL_ASSISTS = ResultStats.GOAL_ASSISTS.value
+_TACKLES = ResultStats.TACKLES.value
+_INTERCEPTIONS = ResultStats.INTERCEPTIONS.value
+
 
 @dataclass
 class Game:
@@ -40,7 +48,6 @@ class WeekOfGames:
         """
         self.games: ArrayR[Game] = games
         self.week: int = week
-        self.current_index: int = 0
 
     def get_games(self) -> ArrayR:
         """
@@ -68,27 +75,16 @@ class WeekOfGames:
         """
         return self.week
 
-    def __iter__(self):
-        """
-        Complexity:
-        Best Case Complexity: O(1)
-        Worst Case Complexity: O(1)
+    def __iter__(self) -> Generator[Game, None, None]:
         """
-        self.current_index = 0
-        return self
+        Iterates over the games in this week. Each call returns an independent iterator.
 
-    def __next__(self):
-        """
         Complexity:
-        Best Case Complexity: O(1)
-        Worst Case Complexity: O(1)
+        Best Case Complexity: O(1) per game
+        Worst Case Complexity: O(1) per game
         """
-        if self.current_index < len(self.games):
-            game = self.games[self.current_index]
-            self.current_index += 1
-            return game
-        else:
-            raise StopIteration
+        for i in range(len(self.games)):
+            yield self.games[i]
 
 
 class Season:
@@ -105,64 +101,82 @@ class Season:
             Worst Case Complexity: O(T^2)
         """
         self.teams = teams
-        self.schedule = LinkedList()
+        self._player_by_name: dict[str, Player] = {}
+        self.__index_players()
+        self.schedule: list[WeekOfGames] = []
+        # Teams with equal stats rank by name, so before any games this is the alphabetical order
         self.leaderboard = ArrayR(len(teams))
         for i in range(len(teams)):
             self.leaderboard[i] = teams[i]
-        # Sort leaderboard by team name first
-        self.leaderboard = self.__sort_leaderboard(self.leaderboard)
+        self.leaderboard = self.__sort_leaderboard_by_stats(self.leaderboard)
+        # Rows of the last get_leaderboard call, valid while every (team, stats version) pair matches
+        self._leaderboard_rows: list[tuple[Union[int, str, ArrayR[GameResult], None], ...]] = []
+        self._leaderboard_versions: tuple[tuple[Team, int], ...] = ()
         # Generate schedule
         raw_schedule = self._generate_schedule()
-        for i, week_games in enumerate(raw_schedule):
-            week = WeekOfGames(i + 1, week_games)
-            self.schedule.append(week)
+        if raw_schedule is not None:
+            for i, week_games in enumerate(raw_schedule):
+                week = WeekOfGames(i + 1, week_games)
+                self.schedule.append(week)
 
-    def _generate_schedule(self) -> ArrayR[ArrayR[Game]]:
+    def _generate_schedule(self) -> Union[ArrayR[ArrayR[Game]], None]:
         """
-        Generates a schedule by generating all possible games between the teams.
+        Generates a round robin schedule using the circle method.
+
+        With n teams (plus a bye when the number of teams is odd), team 0 is held
+        fixed and in week k plays team k, while every other team i plays the team
+        j with i + j = 2k (mod n - 1). Each week therefore has floor(T/2) games and
+        every pair of teams meets exactly once. The second half of the season is
+        the same weeks with home and away flipped.
 
         Return:
             ArrayR[ArrayR[Game]]: The schedule of the season.
                 The outer array is the weeks in the season.
                 The inner array is the games for that given week.
+            None: When there are fewer than two teams, as there are no games to play.
 
         Complexity:
             Best Case Complexity: O(T^2) where T is the number of teams in the season.
             Worst Case Complexity: O(T^2)
         """
         num_teams: int = len(self.teams)
-        weekly_games: list[ArrayR[Game]] = []
-        flipped_weeks: list[ArrayR[Game]] = []
-        games: list[Game] = []
-
-        # Generate all possible matchups (team1 vs team2, team2 vs team1, etc.)
-        for i in range(num_teams):
-            for j in range(i + 1, num_teams):
-                games.append(Game(self.teams[i], self.teams[j]))
-
-        # Allocate games into each week ensuring no team plays more than once in a week
-        week: int = 0
-        while games:
-            current_week: list[Game] = []
-            flipped_week: list[Game] = []
-            used_teams: BSet = BSet()
-
-            week_game_no: int = 0
-            for game in games[:]:  # Iterate over a copy of the list
-                if game.home_team.get_number() not in used_teams and game.away_team.get_number() not in used_teams:
-                    current_week.append(game)
-                    used_teams.add(game.home_team.get_number())
-                    used_teams.add(game.away_team.get_number())
-
-                    flipped_week.append(Game(game.away_team, game.home_team))
-                    games.remove(game)
-                    week_game_no += 1
-
-            weekly_games.append(ArrayR.from_list(current_week))
-            flipped_weeks.append(ArrayR.from_list(flipped_week))
-            week += 1
-
-        return ArrayR.from_list(weekly_games + flipped_weeks)
+        if num_teams < 2:
+            return None  # Nobody to play against
+
+        # Pad to an even number of slots, the extra slot being the bye
+        slots: int = num_teams + (num_teams % 2)
+        rounds: int = slots - 1
+        games_per_week: int = num_teams // 2
+
+        # Every week has the same number of games, so both halves of the season are filled in place
+        schedule: ArrayR[ArrayR[Game]] = ArrayR(2 * rounds)
+        for week in range(1, rounds + 1):
+            current_week: ArrayR[Game] = ArrayR(games_per_week)
+            flipped_week: ArrayR[Game] = ArrayR(games_per_week)
+            game_no: int = 0
+
+            for i in range(rounds):
+                # Slot 0 plays the week's own slot, everyone else pairs on i + j = 2k
+                if i == 0:
+                    j = week
+                elif i == week:
+                    continue
+                else:
+                    j = (2 * week - i) % rounds or rounds
+                    if j < i:
+                        continue
+                if j >= num_teams:
+                    continue  # Bye week for team i
+
+                home_team, away_team = self.teams[i], self.teams[j]
+                current_week[game_no] = Game(home_team, away_team)
+                flipped_week[game_no] = Game(away_team, home_team)
+                game_no += 1
+
+            schedule[week - 1] = current_week
+            schedule[rounds + week - 1] = flipped_week
+
+        return schedule
 
     def simulate_season(self) -> None:
         """
@@ -172,142 +186,80 @@ class Season:
             Assume simulate_game is O(1)
             Remember to define your variables and their complexity.
 
-            Best Case Complexity: O(T^3 * P), where T is the number of teams, P is the maximum number of players per team.
-            Worst Case Complexity: O(T^3 * P)
+            Best Case Complexity: O(T^2 * P), where T is the number of teams, P is the maximum number of players per team.
+            Worst Case Complexity: O(T^2 * P)
         """
+        # Rosters may have changed since the season was created
+        self.__index_players()
+        find = self._player_by_name.get
         for game in self.get_next_game():
             result = GameSimulator.simulate(game.home_team, game.away_team)
-            # Update team statistics
-            home_goals = result[ResultStats.HOME_GOALS.value]
-            away_goals = result[ResultStats.AWAY_GOALS.value]
-
-            # Update team goals
-            game.home_team[TeamStats.GOALS_FOR] += home_goals
-            game.home_team[TeamStats.GOALS_AGAINST] += away_goals
-            game.away_team[TeamStats.GOALS_FOR] += away_goals
-            game.away_team[TeamStats.GOALS_AGAINST] += home_goals
-
-            # Update goal difference
-            game.home_team[TeamStats.GOALS_DIFFERENCE] = game.home_team[TeamStats.GOALS_FOR] - game.home_team[
-                TeamStats.GOALS_AGAINST]
-            game.away_team[TeamStats.GOALS_DIFFERENCE] = game.away_team[TeamStats.GOALS_FOR] - game.away_team[
-                TeamStats.GOALS_AGAINST]
-
-            # Update wins, draws, losses, points, and last five results
+            home_goals = result[_HOME_GOALS]
+            away_goals = result[_AWAY_GOALS]
+
+            # Update team statistics, points, last five results and players' games played
             if home_goals > away_goals:
-                game.home_team[TeamStats.WINS] += 1
-                game.away_team[TeamStats.LOSSES] += 1
+                home_result, away_result = GameResult.WIN, GameResult.LOSS
             elif home_goals < away_goals:
-                game.home_team[TeamStats.LOSSES] += 1
-                game.away_team[TeamStats.WINS] += 1
+                home_result, away_result = GameResult.LOSS, GameResult.WIN
             else:
-                game.home_team[TeamStats.DRAWS] += 1
-                game.away_team[TeamStats.DRAWS] += 1
-
-            # Update player statistics
-            goal_scorers = result[ResultStats.GOAL_SCORERS.value]
-            goal_assists = result[ResultStats.GOAL_ASSISTS.value]
-            tackles = result[ResultStats.TACKLES.value]
-            interceptions = result[ResultStats.INTERCEPTIONS.value]
-
-            if goal_scorers is not None:
-                for scorer_name in goal_scorers:
-                    player = self.__find_player_by_name(scorer_name)
-                    if player:
-                        player[PlayerStats.GOALS] += 1
-
-            if goal_assists is not None:
-                for assist_name in goal_assists:
-                    player = self.__find_player_by_name(assist_name)
-                    if player:
-                        player[PlayerStats.ASSISTS] += 1
-
-            if tackles is not None:
-                for tackler_name in tackles:
-                    player = self.__find_player_by_name(tackler_name)
-                    if player:
-                        player[PlayerStats.TACKLES] += 1
-
-            if interceptions is not None:
-                for interceptor_name in interceptions:
-                    player = self.__find_player_by_name(interceptor_name)
+                home_result, away_result = GameResult.DRAW, GameResult.DRAW
+            game.home_team._record_result(home_result, home_goals, away_goals)
+            game.away_team._record_result(away_result, away_goals, home_goals)
+
+            # Update player statistics, once per distinct player and stat
+            for names, stat in ((result[_GOAL_SCORERS], PlayerStats.GOALS),
+                                (result[_GOAL_ASSISTS], PlayerStats.ASSISTS),
+                                (result[_TACKLES], PlayerStats.TACKLES),
+                                (result[_INTERCEPTIONS], PlayerStats.INTERCEPTIONS)):
+                if names is None:
+                    continue
+                for name, count in Counter(names).items():
+                    player = find(name)
                     if player:
-                        player[PlayerStats.INTERCEPTIONS] += 1
+                        player[stat] += count
 
-            # After simulating all games, update the leaderboard
+        # After simulating all games, update the leaderboard
         self.leaderboard = self.__sort_leaderboard_by_stats(self.leaderboard)
 
-    def __find_player_by_name(self, name: str) -> Union[Player, None]:
+    def __index_players(self) -> None:
         """
-        Finds a player by name among all teams.
+        Rebuilds the name -> player index over all teams.
+        When two players share a name, the first one found (in team order) is kept.
 
         Complexity:
-            Best Case Complexity: O(1), if the player is found in the first team.
-            Worst Case Complexity: O(T * P), where T is the number of teams, P is the maximum number of players per team.
+            Best Case Complexity: O(T * P), where T is the number of teams, P is the maximum number of players per team.
+            Worst Case Complexity: O(T * P)
         """
+        player_by_name = {}
         for team in self.teams:
             players = team.get_players()
             if players is None:
                 continue
             for player in players:
-                if player.get_name() == name:
-                    return player
-        return None
-
-    def __sort_leaderboard(self, leaderboard: ArrayR[Team]) -> ArrayR[Team]:
-        """
-        Sorts the leaderboard by team name.
-
-        Complexity:
-            Best Case Complexity: O(T^2), where T is the number of teams.
-            Worst Case Complexity: O(T^2)
-        """
-        # Simple insertion sort
-        for i in range(1, len(leaderboard)):
-            key = leaderboard[i]
-            j = i - 1
-            while j >= 0 and leaderboard[j].get_name() > key.get_name():
-                leaderboard[j + 1] = leaderboard[j]
-                j -= 1
-            leaderboard[j + 1] = key
-        return leaderboard
+                name = player.get_name()
+                if name not in player_by_name:
+                    player_by_name[name] = player
+        self._player_by_name = player_by_name
 
     def __sort_leaderboard_by_stats(self, leaderboard: ArrayR[Team]) -> ArrayR[Team]:
         """
         Sorts the leaderboard based on points, goal difference, goals for, and team name.
 
         Complexity:
-            Best Case Complexity: O(T^2), where T is the number of teams.
-            Worst Case Complexity: O(T^2)
-        """
-        # Insertion sort
-        for i in range(1, len(leaderboard)):
-            key = leaderboard[i]
-            j = i - 1
-            while j >= 0 and self.__compare_teams(key, leaderboard[j]):
-                leaderboard[j + 1] = leaderboard[j]
-                j -= 1
-            leaderboard[j + 1] = key
+            Best Case Complexity: O(T log T), where T is the number of teams.
+            Worst Case Complexity: O(T log T)
+        """
+        # Read each team's ranking stats once, then order the keys rather than comparing teams pairwise
+        keys = []
+        for i, team in enumerate(leaderboard):
+            keys.append((-team[TeamStats.POINTS], -team[TeamStats.GOALS_DIFFERENCE], -team[TeamStats.GOALS_FOR],
+                         team.get_name(), i))
+        ranked = [leaderboard[key[-1]] for key in mergesort(keys)]
+        for i, team in enumerate(ranked):
+            leaderboard[i] = team
         return leaderboard
 
-    def __compare_teams(self, team1: Team, team2: Team) -> bool:
-        """
-        Returns True if team1 should come before team2.
-
-        Complexity: O(1)
-        """
-        if team1[TeamStats.POINTS] > team2[TeamStats.POINTS]:
-            return True
-        elif team1[TeamStats.POINTS] == team2[TeamStats.POINTS]:
-            if team1[TeamStats.GOALS_DIFFERENCE] > team2[TeamStats.GOALS_DIFFERENCE]:
-                return True
-            elif team1[TeamStats.GOALS_DIFFERENCE] == team2[TeamStats.GOALS_DIFFERENCE]:
-                if team1[TeamStats.GOALS_FOR] > team2[TeamStats.GOALS_FOR]:
-                    return True
-                elif team1[TeamStats.GOALS_FOR] == team2[TeamStats.GOALS_FOR]:
-                    return team1.get_name() < team2.get_name()
-        return False
-
     def delay_week_of_games(self, orig_week: int, new_week: Union[int, None] = None) -> None:
         """
         Delay a week of games from one week to another.
@@ -317,7 +269,7 @@ class Season:
             new_week (Union[int, None]): The new week to move the games to. If this is None, it moves the games to the end of the season.
 
         Complexity:
-            Best Case Complexity: O(1), if moving within the same position.
+            Best Case Complexity: O(1), if moving the last week to the end of the season.
             Worst Case Complexity: O(W), where W is the number of weeks in the season.
         """
         if orig_week < 1 or orig_week > len(self.schedule):
@@ -325,16 +277,13 @@ class Season:
         if new_week is not None and (new_week < 1 or new_week > len(self.schedule)):
             raise ValueError("Invalid new week")
 
-        orig_week_index = orig_week - 1
-        week_to_move = self.schedule[orig_week_index]
-        self.schedule.delete_at_index(orig_week_index)
+        week_to_move = self.schedule.pop(orig_week - 1)
 
         if new_week is None:
             # Move to the end of the season
             self.schedule.append(week_to_move)
         else:
-            new_week_index = new_week - 1
-            self.schedule.insert(new_week_index, week_to_move)
+            self.schedule.insert(new_week - 1, week_to_move)
 
     def get_next_game(self) -> Generator[Game, None, None]:
         """
@@ -349,17 +298,16 @@ class Season:
             Worst Case Complexity: O(1) per game retrieval.
         """
         for week in self.schedule:
-            for game in week:
-                yield game
+            yield from week.get_games()
 
-    def get_leaderboard(self) -> ArrayR[ArrayR[Union[int, str]]]:
+    def get_leaderboard(self) -> ArrayR[tuple[Union[int, str, ArrayR[GameResult], None], ...]]:
         """
         Generates the final season leaderboard.
 
         Returns:
-            ArrayR(ArrayR[ArrayR[Union[int, str]]]):
+            ArrayR(tuple[Union[int, str, ArrayR[GameResult], None], ...]):
                 Outer array represents each team in the leaderboard
-                Inner array consists of 10 elements:
+                Inner tuple consists of 10 elements:
                     - Team name (str)
                     - Games Played (int)
                     - Points (int)
@@ -369,33 +317,39 @@ class Season:
                     - Goals For (int)
                     - Goals Against (int)
                     - Goal Difference (int)
-                    - Previous Five Results (ArrayR(str)) where result should be WIN LOSS OR DRAW
+                    - Previous Five Results (ArrayR(GameResult)) where result should be WIN LOSS OR DRAW,
+                      or None if the team has not played yet
+
+        The rows are cached and rebuilt only when a team's stats version or the
+        leaderboard order changed since the previous call. Each call gets its own
+        outer ArrayR, but the rows in it are shared and should be treated as read-only.
 
         Complexity:
-            Best Case Complexity: O(T), where T is the number of teams.
+            Best Case Complexity: O(T), where T is the number of teams. The rows are cached, only the versions are checked.
             Worst Case Complexity: O(T)
         """
-        leaderboard_data = ArrayR(len(self.leaderboard))
-        for i, team in enumerate(self.leaderboard):
-            team_data = ArrayR(10)
-            team_data[0] = team.get_name()
-            team_data[1] = team[TeamStats.GAMES_PLAYED]
-            team_data[2] = team[TeamStats.POINTS]
-            team_data[3] = team[TeamStats.WINS]
-            team_data[4] = team[TeamStats.DRAWS]
-            team_data[5] = team[TeamStats.LOSSES]
-            team_data[6] = team[TeamStats.GOALS_FOR]
-            team_data[7] = team[TeamStats.GOALS_AGAINST]
-            team_data[8] = team[TeamStats.GOALS_DIFFERENCE]
-            last_five = team.get_last_five_results()
-            if last_five is not None:
-                last_five_results = ArrayR(len(last_five))
-                for j, result in enumerate(last_five):
-                    last_five_results[j] = result
-                team_data[9] = last_five_results
-            else:
-                team_data[9] = ArrayR(0)
-            leaderboard_data[i] = team_data
+        versions = tuple((team, team._stats_version) for team in self.leaderboard)
+        if versions != self._leaderboard_versions:
+            self._leaderboard_rows = [
+                (
+                    team.get_name(),
+                    team[TeamStats.GAMES_PLAYED],
+                    team[TeamStats.POINTS],
+                    team[TeamStats.WINS],
+                    team[TeamStats.DRAWS],
+                    team[TeamStats.LOSSES],
+                    team[TeamStats.GOALS_FOR],
+                    team[TeamStats.GOALS_AGAINST],
+                    team[TeamStats.GOALS_DIFFERENCE],
+                    team.get_last_five_results(),
+                )
+                for team in self.leaderboard
+            ]
+            self._leaderboard_versions = versions
+
+        leaderboard_data = ArrayR(len(self._leaderboard_rows))
+        for i, row in enumerate(self._leaderboard_rows):
+            leaderboard_data[i] = row
         return leaderboard_data
 
     def get_teams(self) -> ArrayR[Team]:
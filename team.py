@@ -1,6 +1,8 @@
 from __future__ import annotations
+from array import array
+from collections import deque
+from algorithms.mergesort import mergesort
 from data_structures.referential_array import ArrayR
-from data_structures.hash_table import LinearProbeTable
 from data_structures.linked_list import LinkedList
 from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
 from player import Player
@@ -8,6 +10,57 @@ from typing import Collection, Union, TypeVar
 
 T = TypeVar("T")
 
+# Number of most recent results a team remembers
+_LAST_FIVE_LENGTH = 5
+
+# Numeric statistics are packed as 64-bit signed ints instead of boxed Python ints
+_STAT_TYPECODE = 'q'
+
+# Positions in Team.statistics
+_GAMES_PLAYED = TeamStats.GAMES_PLAYED.ordinal
+_POINTS = TeamStats.POINTS.ordinal
+_GOALS_FOR = TeamStats.GOALS_FOR.ordinal
+_GOALS_AGAINST = TeamStats.GOALS_AGAINST.ordinal
+_GOALS_DIFFERENCE = TeamStats.GOALS_DIFFERENCE.ordinal
+# The counter statistic that tallies each kind of result, and the reverse mapping
+_RESULT_COUNTERS = {
+    GameResult.WIN: TeamStats.WINS.ordinal,
+    GameResult.DRAW: TeamStats.DRAWS.ordinal,
+    GameResult.LOSS: TeamStats.LOSSES.ordinal,
+}
+_COUNTED_RESULTS = {
+    TeamStats.WINS: GameResult.WIN,
+    TeamStats.DRAWS: GameResult.DRAW,
+    TeamStats.LOSSES: GameResult.LOSS,
+}
+
+
+def _add_goals(stats: array[int], goals_for: int, goals_against: int) -> None:
+    """
+    Adds goals scored and conceded to a team's statistics, keeping the goal difference in step.
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    stats[_GOALS_FOR] += goals_for
+    stats[_GOALS_AGAINST] += goals_against
+    stats[_GOALS_DIFFERENCE] += goals_for - goals_against
+
+
+def _add_results(stats: array[int], result: GameResult, count: int) -> None:
+    """
+    Adds count games with the given result to a team's statistics,
+    keeping the games played and points in step. A negative count removes games.
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    stats[_RESULT_COUNTERS[result]] += count
+    stats[_GAMES_PLAYED] += count
+    stats[_POINTS] += count * result.value
+
 
 class Team:
     _team_counter = 0
@@ -31,14 +84,14 @@ class Team:
         Team._team_counter += 1
 
         self.name = team_name
-        self.statistics = LinearProbeTable()
-        for stat in TeamStats:
-            if stat == TeamStats.LAST_FIVE_RESULTS:
-                self.statistics[stat.value] = LinkedList()
-            else:
-                self.statistics[stat.value] = 0
-
-        self.players = LinearProbeTable()
+        # One slot per TeamStats member, read and written by the member's ordinal.
+        # The LAST_FIVE_RESULTS slot is unused, those results live in their own deque.
+        self.statistics: array[int] = array(_STAT_TYPECODE, [0]) * len(TeamStats)
+        self._last_five: deque[GameResult] = deque(maxlen=_LAST_FIVE_LENGTH)
+        # Bumped on every statistics write, so cached views of the stats can tell they are stale
+        self._stats_version = 0
+
+        self.players: dict[PlayerPosition, LinkedList[Player]] = {}
         for player in players:
             self.add_player(player)
 
@@ -50,11 +103,9 @@ class Team:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        for stat in TeamStats:
-            if stat == TeamStats.LAST_FIVE_RESULTS:
-                self.statistics[stat.value] = LinkedList()
-            else:
-                self.statistics[stat.value] = 0
+        self.statistics[:] = array(_STAT_TYPECODE, [0]) * len(self.statistics)
+        self._last_five.clear()
+        self._stats_version += 1
 
     def add_player(self, player: Player) -> None:
         """
@@ -70,7 +121,7 @@ class Team:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        position = player.get_position().value  # Convert enum to string
+        position = player.get_position()
         if position not in self.players:
             self.players[position] = LinkedList()
         self.players[position].append(player)
@@ -87,18 +138,17 @@ class Team:
 
         Complexity:
             Best Case Complexity: O(1), if the player is at the beginning of the list.
-            Worst Case Complexity: O(N_p^2), where N_p is the number of players in that position.
+            Worst Case Complexity: O(N_p), where N_p is the number of players in that position.
 
         """
-        position = player.get_position().value  # Convert enum to string
+        position = player.get_position()
         if position in self.players:
             player_list = self.players[position]
-            index = 0
-            while index < len(player_list):
-                if player_list[index] == player:
+            # Walk the nodes once, counting the position, rather than indexing from the head each step
+            for index, current in enumerate(player_list):
+                if current == player:
                     player_list.delete_at_index(index)
                     break
-                index += 1
             if len(player_list) == 0:
                 del self.players[position]
 
@@ -144,26 +194,21 @@ class Team:
         if position is None:
             players_list = []
             for pos in PlayerPosition:
-                pos_value = pos.value
-                if pos_value in self.players:
-                    for player in self.players[pos_value]:
+                if pos in self.players:
+                    for player in self.players[pos]:
                         players_list.append(player)
             if not players_list:
                 return None
             return ArrayR.from_list(players_list)
         else:
-            position_value = position.value
-            if position_value in self.players:
-                return self.players[position_value]
-            else:
-                return None
+            return self.players.get(position)
 
     def get_statistics(self):
         """
         Get the statistics of the team
 
         Returns:
-            statistics: The teams' statistics
+            statistics: The teams' numeric statistics, indexed by TeamStats ordinal
 
         Complexity:
             Best Case Complexity: O(1)
@@ -196,11 +241,11 @@ class Team:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        last_five = self.statistics[TeamStats.LAST_FIVE_RESULTS.value]
+        last_five = self._last_five
         if len(last_five) == 0:
             return None
         else:
-            return last_five
+            return ArrayR.from_list(list(last_five))
 
     def get_top_x_players(self, player_stat: PlayerStats, num_players: int) -> list[tuple[int, str, Player]]:
         """
@@ -211,12 +256,48 @@ class Team:
             num_players (int): The number of players to return from this team
 
         Return:
-            list[tuple[int, str, Player]]: The top x players from this team
+            list[tuple[int, str, Player]]: The top x players from this team,
+            ordered by the stat (descending) and then by name (ascending)
         Complexity:
-            Best Case Complexity:
-            Worst Case Complexity:
+            Best Case Complexity: O(P log P), where P is the number of players in the team.
+            Worst Case Complexity: O(P log P)
         """
-        raise NotImplementedError
+        players = self.get_players()
+        if players is None or num_players <= 0:
+            return []
+
+        # Gather the stat as one column across all players, then order the column once
+        ordinal = player_stat.ordinal
+        column = [(-player.statistics[ordinal], player.get_name(), i) for i, player in enumerate(players)]
+        ranked = mergesort(column)
+
+        top_players = []
+        for negated_value, name, i in ranked[:num_players]:
+            top_players.append((-negated_value, name, players[i]))
+        return top_players
+
+    def _record_result(self, result: GameResult, goals_for: int, goals_against: int) -> None:
+        """
+        Records a single played game against the team's statistics.
+
+        Equivalent to bumping the goals and the WINS/DRAWS/LOSSES counter through
+        __setitem__, but every derived statistic is written once, directly.
+
+        Args:
+            result (GameResult): The result of the game for this team
+            goals_for (int): The goals this team scored
+            goals_against (int): The goals this team conceded
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of players in the team.
+            Worst Case Complexity: O(N)
+        """
+        stats = self.statistics
+        _add_goals(stats, goals_for, goals_against)
+        _add_results(stats, result, 1)
+        self.__update_last_five_results(result, 1)
+        self.__update_players_games_played(1)
+        self._stats_version += 1
 
     def __setitem__(self, statistic: TeamStats, value: int) -> None:
         """
@@ -230,36 +311,28 @@ class Team:
             Best Case Complexity: O(N), where N is the number of players in the team.
             Worst Case Complexity: O(N)
         """
-        old_value = self.statistics[statistic.value]
-        self.statistics[statistic.value] = value
-
-        if statistic == TeamStats.WINS:
-            delta = value - old_value
-            self.statistics[TeamStats.POINTS.value] += delta * GameResult.WIN.value
-            self.statistics[TeamStats.GAMES_PLAYED.value] += delta
-            self.__update_last_five_results(GameResult.WIN, delta)
-            self.__update_players_games_played(delta)
-        elif statistic == TeamStats.DRAWS:
-            delta = value - old_value
-            self.statistics[TeamStats.POINTS.value] += delta * GameResult.DRAW.value
-            self.statistics[TeamStats.GAMES_PLAYED.value] += delta
-            self.__update_last_five_results(GameResult.DRAW, delta)
-            self.__update_players_games_played(delta)
-        elif statistic == TeamStats.LOSSES:
-            delta = value - old_value
-            self.statistics[TeamStats.GAMES_PLAYED.value] += delta
-            self.__update_last_five_results(GameResult.LOSS, delta)
+        self._stats_version += 1
+        if statistic is TeamStats.LAST_FIVE_RESULTS:
+            # Copy the given results, keeping only the newest ones that fit
+            self._last_five = deque(value if value is not None else (), maxlen=_LAST_FIVE_LENGTH)
+            return
+
+        stats = self.statistics
+        delta = value - stats[statistic.ordinal]
+
+        if statistic in _COUNTED_RESULTS:
+            result = _COUNTED_RESULTS[statistic]
+            _add_results(stats, result, delta)
+            self.__update_last_five_results(result, delta)
             self.__update_players_games_played(delta)
         elif statistic == TeamStats.GOALS_FOR:
-            delta = value - old_value
-            self.statistics[TeamStats.GOALS_DIFFERENCE.value] += delta
+            _add_goals(stats, delta, 0)
         elif statistic == TeamStats.GOALS_AGAINST:
-            delta = value - old_value
-            self.statistics[TeamStats.GOALS_DIFFERENCE.value] -= delta
+            _add_goals(stats, 0, delta)
         else:
-            self.statistics[statistic.value] = value
+            stats[statistic.ordinal] = value
 
-    def __getitem__(self, statistic: TeamStats) -> int:
+    def __getitem__(self, statistic: TeamStats) -> Union[int, ArrayR[GameResult], None]:
         """
         Returns the value of the specified statistic.
 
@@ -268,6 +341,7 @@ class Team:
 
         Returns:
             int: The value of the specified statistic
+            For LAST_FIVE_RESULTS, an ArrayR snapshot of the results as given by get_last_five_results
 
         Raises:
             ValueError: If the statistic is invalid
@@ -276,40 +350,41 @@ class Team:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self.statistics[statistic.value]
+        if statistic is TeamStats.LAST_FIVE_RESULTS:
+            return self.get_last_five_results()
+        return self.statistics[statistic.ordinal]
 
     def __len__(self) -> int:
         """
         Returns the number of players in the team.
 
         Complexity:
-            Best Case Complexity: O(1), if team has no players.
-            Worst Case Complexity: O(N), where N is the number of players in the team.
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1), there is at most one list per PlayerPosition.
         """
         count = 0
-        if not self.players.is_empty():
-            for position in self.players.keys():
-                count += len(self.players[position])
+        for player_list in self.players.values():
+            count += len(player_list)
         return count
 
     def __update_last_five_results(self, result: GameResult, delta: int) -> None:
-        last_five = self.statistics[TeamStats.LAST_FIVE_RESULTS.value]
+        last_five = self._last_five
         if delta > 0:
             for _ in range(delta):
-                last_five.append(result)
-                if len(last_five) > 5:
-                    last_five.delete_at_index(0)
+                last_five.append(result)  # The deque drops the oldest result once full
         elif delta < 0:
             for _ in range(-delta):
                 # Remove from end
                 for i in range(len(last_five) - 1, -1, -1):
                     if last_five[i] == result:
-                        last_five.delete_at_index(i)
+                        del last_five[i]
                         break
 
     def __update_players_games_played(self, delta: int) -> None:
-        for player in self.get_players():
-            player[PlayerStats.GAMES_PLAYED] += delta
+        # Walk the live position lists, no ArrayR of the roster is needed just to update it
+        for player_list in self.players.values():
+            for player in player_list:
+                player[PlayerStats.GAMES_PLAYED] += delta
 
     def __str__(self) -> str:
         """
@@ -1,9 +1,10 @@
 from unittest import TestCase
 
+from data_structures.linked_list import LinkedList
 from data_structures.referential_array import ArrayR
 from ed_utils.decorators import number, visibility
 from tests.helper import take_out_from_adt
-from constants import GameResult, PlayerPosition, TeamStats
+from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
 from player import Player
 from team import Team
 
@@ -396,3 +397,98 @@ class TestTask2(TestCase):
         self.assertEqual(len(players), len(expected), "Incorrect number of players returned")
         for i in range(len(players)):
             self.assertEqual(players[i], expected[i], "Incorrect player returned / order of players incorrect")
+
+    @number("2.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_top_x_players(self):
+        """
+        Testing if the top players are ordered by the stat, then by name.
+        """
+        sample_team = self.sample_team
+        goals = {"Alexey": 3, "Maria": 5, "Brendon": 3, "Saksham": 0, "Rupert": 1}
+        for player in self.sample_players:
+            player[PlayerStats.GOALS] = goals[player.get_name()]
+
+        top_players = sample_team.get_top_x_players(PlayerStats.GOALS, 3)
+
+        expected = [(5, "Maria"), (3, "Alexey"), (3, "Brendon")]
+        self.assertEqual(len(top_players), len(expected), "Incorrect number of players returned")
+        for (value, name, player), (expected_value, expected_name) in zip(top_players, expected):
+            self.assertEqual(value, expected_value, f"{name} should have {expected_value} goals")
+            self.assertEqual(name, expected_name, "Top players not ordered correctly")
+            self.assertEqual(player.get_name(), expected_name, "Player does not match its name")
+
+        self.assertEqual(len(sample_team.get_top_x_players(PlayerStats.GOALS, 10)), len(self.sample_players),
+                         "Asking for more players than the team has should return all of them")
+
+    @number("2.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_players_after_roster_change(self):
+        """
+        Testing that get_players reflects players added or removed after a previous call.
+        """
+        sample_team = self.sample_team
+        self.assertEqual(len(sample_team.get_players()), len(self.sample_players), "Incorrect number of players")
+
+        new_player = Player("Lisa", PlayerPosition.STRIKER, 25)
+        sample_team.add_player(new_player)
+        players = sample_team.get_players()
+        self.assertEqual(len(players), len(self.sample_players) + 1, "Added player missing from get_players")
+        self.assertIn(new_player, take_out_from_adt(players), "Added player missing from get_players")
+
+        sample_team.remove_player(self.sample_players[0])
+        players = sample_team.get_players()
+        self.assertEqual(len(players), len(self.sample_players), "Removed player still returned by get_players")
+        self.assertNotIn(self.sample_players[0], take_out_from_adt(players), "Removed player still returned")
+
+    @number("2.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_last_five_stat(self) -> None:
+        """
+        Testing that the LAST_FIVE_RESULTS statistic is held in a valid ADT.
+        """
+        sample_team = self.sample_team
+        sample_team[TeamStats.WINS] += 1
+        sample_team[TeamStats.DRAWS] += 1
+
+        last_five = take_out_from_adt(sample_team[TeamStats.LAST_FIVE_RESULTS])
+        self.assertEqual(len(last_five), 2, "The last five results should hold a win and a draw")
+        self.assertEqual(last_five[0], GameResult.WIN, "The oldest result should be a `GameResult.WIN`")
+        self.assertEqual(last_five[1], GameResult.DRAW, "The newest result should be a `GameResult.DRAW`")
+
+    @number("2.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_last_five_stat_assigned(self) -> None:
+        """
+        Testing that assigning the LAST_FIVE_RESULTS statistic keeps it limited to five results.
+        """
+        sample_team = self.sample_team
+        sample_team[TeamStats.LAST_FIVE_RESULTS] = LinkedList()
+        for _ in range(7):
+            sample_team[TeamStats.WINS] += 1
+
+        last_five = take_out_from_adt(sample_team.get_last_five_results())
+        self.assertEqual(len(last_five), 5, "The last five results should hold a maximum of 5 elements")
+
+    @number("2.17")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_players_position_list_changes(self):
+        """
+        Testing that get_players and games played follow changes made through a position's player list,
+        and that changing the returned array does not change the team.
+        """
+        sample_team = self.sample_team
+        sample_team.get_players()
+
+        new_player = Player("Lisa", PlayerPosition.STRIKER, 25)
+        sample_team.get_players(PlayerPosition.STRIKER).append(new_player)
+        players = sample_team.get_players()
+        self.assertEqual(len(players), len(sample_team), "get_players should match the team length")
+        self.assertIn(new_player, take_out_from_adt(players), "Player added to a position list missing from get_players")
+
+        sample_team[TeamStats.WINS] += 1
+        self.assertEqual(new_player[PlayerStats.GAMES_PLAYED], 1, "Player added to a position list should play the game")
+
+        players[0] = new_player
+        self.assertIn(self.sample_players[0], take_out_from_adt(sample_team.get_players()),
+                      "Changing the returned array should not change the team")
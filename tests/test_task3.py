@@ -74,3 +74,60 @@ class TestTask3(TestCase):
                 self.assertEqual(self.step_table[lookup_table[j]], lookup_table[j], f"Letter not found after deletion")
 
             self.assertEqual(len(self.step_table), len(lookup_table) - i - 1, f"Wrong length: expected {len(PlayerStats) - i - 1}, got {len(self.step_table)}")
+
+    @number("3.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_perfect_hash_keys_values(self):
+        # Only store the last few stats so the occupied positions sit beyond len(table)
+        stored_stats = list(PlayerStats)[-3:]
+        for i, player_stat in enumerate(stored_stats):
+            self.perfect_table[player_stat.value] = i
+
+        keys = self.perfect_table.keys()
+        values = self.perfect_table.values()
+        for i, player_stat in enumerate(stored_stats):
+            self.assertEqual(keys[i], player_stat.value, f"Key {i} should be {player_stat.value}, got {keys[i]}")
+            self.assertEqual(values[i], i, f"Value {i} should be {i}, got {values[i]}")
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_hash_overridden_unhashable_keys(self):
+        # Non-string keys are supported by overriding hash and hash2, even when they cannot go in a dict
+        self.step_table = HashyStepTable([97])
+        self.step_table.hash = lambda _: 0
+        self.step_table.hash2 = lambda _: 1
+        keys: list[list[int]] = [[i] for i in range(5)]
+
+        for i, key in enumerate(keys):
+            self.step_table[key] = i
+        for i, key in enumerate(keys):
+            self.assertEqual(self.step_table[key], i, f"Key {key} not set to {i}")
+
+        del self.step_table[keys[2]]
+        self.assertNotIn(keys[2], self.step_table, "Deleted key still found")
+        self.assertEqual(len(self.step_table), len(keys) - 1, f"Wrong length: expected {len(keys) - 1}, got {len(self.step_table)}")
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_hash_update_after_delete(self):
+        # Every key collides on the same probe chain: A, B, C, D, E take slots 0 to 4
+        self.step_table = HashyStepTable([97])
+        self.step_table.hash = lambda _: 0
+        self.step_table.hash2 = lambda _: 1
+        for letter in ['A', 'B', 'C', 'D', 'E']:
+            self.step_table[letter] = letter.lower()
+
+        del self.step_table['B']
+
+        # Updating a key further along the chain must not store a second copy in the deleted slot
+        self.step_table['D'] = 'updated'
+        self.assertEqual(len(self.step_table), 4, f"Wrong length: expected 4, got {len(self.step_table)}")
+        self.assertEqual(sorted(self.step_table.keys()), ['A', 'C', 'D', 'E'], "Keys wrong after updating past a deleted slot")
+        self.assertEqual(self.step_table['D'], 'updated', "Updated value not found")
+
+        # A new key may reuse the deleted slot, and it still counts as a new entry
+        self.step_table['F'] = 'f'
+        self.assertEqual(len(self.step_table), 5, f"Wrong length: expected 5, got {len(self.step_table)}")
+        self.assertEqual(sorted(self.step_table.keys()), ['A', 'C', 'D', 'E', 'F'], "Keys wrong after reusing a deleted slot")
+        self.assertEqual(sorted(self.step_table.values()), ['a', 'c', 'e', 'f', 'updated'], "Values wrong after reusing a deleted slot")
+        self.assertEqual(str(self.step_table).count("("), 5, "String should hold exactly the stored pairs")
@@ -133,4 +133,19 @@ class TestTask4(TestCase):
         # Check the order of the leaderboard should be according to the name of the teams
         sorted_teams: ArrayR[Team] = sorted(self.teams, key=lambda team: team.get_name())
         for i, team in enumerate(self.season.leaderboard):
-            self.assertEqual(team.get_name(), sorted_teams[i].get_name(), "Leaderboard not sorted correctly")
\ No newline at end of file
+            self.assertEqual(team.get_name(), sorted_teams[i].get_name(), "Leaderboard not sorted correctly")
+
+    @number("4.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_schedule_weeks_balanced(self):
+        self.season = Season(self.teams)
+        num_teams: int = len(self.teams)
+        self.assertEqual(len(self.season.schedule), 2 * (num_teams - 1), "Wrong number of weeks")
+
+        for week_of_games in self.season.schedule:
+            team_names: list[str] = []
+            for game in week_of_games:
+                team_names.append(game.home_team.get_name())
+                team_names.append(game.away_team.get_name())
+            self.assertEqual(len(team_names), 2 * (num_teams // 2), "Week does not have T/2 games")
+            self.assertEqual(len(set(team_names)), len(team_names), "A team plays more than once in a week")
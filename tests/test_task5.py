@@ -9,6 +9,7 @@ from constants import Constants, GameResult
 from player import Player
 from random_gen import RandomGen
 from season import Season
+from awards import Awards
 from team import Team
 from typing import Union
 
@@ -146,3 +147,80 @@ class TestTask5(TestCase):
             player = players_dict[player_name]
             for stat, value in stats.items():
                 self.assertEqual(value, player[stat], f"{player_name} {stat} not correct")
+
+    @number("5.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_leaderboard_before_and_after_season(self):
+        teams = Roster.generate_teams(4)
+        self.season = Season(teams)
+
+        # Before any games are played every team has an empty row
+        for row in self.season.get_leaderboard():
+            self.assertEqual(list(row[1:9]), [0] * 8, "Stats should be zero before the season")
+            self.assertIsNone(row[9], "No results should be recorded before the season")
+
+        self.season.simulate_season()
+        leaderboard = self.season.get_leaderboard()
+        for row in leaderboard:
+            self.assertEqual(row[1], 6, "Leaderboard not refreshed after the season was simulated")
+        self.assertEqual(leaderboard[0][0], 'Badgers', "Leaderboard not ordered after the season was simulated")
+
+    @number("5.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_awards_leaderboard(self):
+        big_team_players: list[Player] = [
+            Player("Alexey", PlayerPosition.STRIKER, 22),
+            Player("Maria", PlayerPosition.MIDFIELDER, 22),
+            Player("Brendon", PlayerPosition.DEFENDER, 22),
+        ]
+        small_team_players: list[Player] = [Player("Saksham", PlayerPosition.GOALKEEPER, 22)]
+        goals = {"Alexey": 2, "Maria": 4, "Brendon": 1, "Saksham": 3}
+        for player in big_team_players + small_team_players:
+            player[PlayerStats.GOALS] = goals[player.get_name()]
+        teams: ArrayR[Team] = ArrayR.from_list([
+            Team("Big Team", ArrayR.from_list(big_team_players)),
+            Team("Small Team", ArrayR.from_list(small_team_players)),
+        ])
+        self.season = Season(teams)
+
+        # The small team only has one player to give, so there are no empty entries
+        leaderboard = Awards(self.season, PlayerStats.GOALS, 2).get_leaderboard()
+        expected: list[tuple[str, int]] = [("Maria", 4), ("Alexey", 2), ("Saksham", 3)]
+        self.assertEqual(len(leaderboard), len(expected), "Awards leaderboard has the wrong number of entries")
+        for i, (name, goal_count) in enumerate(expected):
+            self.assertEqual(leaderboard[i][0], name, "Awards leaderboard not ordered correctly")
+            self.assertEqual(leaderboard[i][2], goal_count, f"{name} should have {goal_count} goals")
+
+        self.assertIsNone(Awards(self.season, PlayerStats.GOALS, 0).get_leaderboard(),
+                          "No players are tracked when num_top_players is 0")
+        self.assertIsNone(Awards(self.season, None, 2).get_leaderboard(),
+                          "No players are tracked without an award stat")
+
+    @number("5.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_leaderboard_reflects_stat_changes(self):
+        teams = Roster.generate_teams(4)
+        self.season = Season(teams)
+        self.season.simulate_season()
+
+        first_leaderboard = self.season.get_leaderboard()
+        team_name = first_leaderboard[0][0]
+        self.assertEqual(first_leaderboard[0][1], 6, "All teams should have played 6 games")
+
+        # Changing a team's stats between calls must show up in the next leaderboard
+        leader = [team for team in teams if team.get_name() == team_name][0]
+        leader.reset_stats()
+        second_leaderboard = self.season.get_leaderboard()
+        self.assertEqual(second_leaderboard[0][0], team_name, "Leaderboard order only changes when simulating")
+        self.assertEqual(second_leaderboard[0][1], 0, "Leaderboard should show the reset games played")
+        self.assertIsNone(second_leaderboard[0][9], "Leaderboard should show the reset last five results")
+
+        leader[TeamStats.GOALS_FOR] = 9
+        self.assertEqual(self.season.get_leaderboard()[0][6], 9, "Leaderboard should show the updated goals for")
+
+        # Without changes the cached rows are reused, but the returned array is the caller's own
+        cached = self.season.get_leaderboard()
+        repeat = self.season.get_leaderboard()
+        self.assertIs(cached[0], repeat[0], "Unchanged stats should reuse the cached rows")
+        cached[0] = None
+        self.assertIsNotNone(self.season.get_leaderboard()[0], "Mutating a returned leaderboard must not affect the cache")